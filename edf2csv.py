@@ -1,9 +1,6 @@
-import numpy as np
+import pandas as pd
 import mne
 
 edf = mne.io.read_raw_edf('example.edf')
 data_array = edf.get_data().T 
-header = ','.join(edf.ch_names)
-with open('example.csv', 'w'):  
-    pass
-np.savetxt('example.csv', data_array, delimiter=',', header=header)
+pd.DataFrame(data_array, columns=edf.ch_names).to_csv('example.csv', index=False, float_format='%.6g', chunksize=100_000)
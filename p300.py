@@ -17,6 +17,7 @@ class Window(QMainWindow):
         self.data_stream = []
         self.frequency = 25 # interval of the timer and recording, in ms, which is also the block size when writing to .edf
         self.interval = 500 # interval between the visual stimulus, in ms
+        self.samplesPerStimulus = self.interval // self.frequency # number of timer ticks between the visual stimulus
  
         # Setting geometry to main window
         self.desktop = QApplication.desktop()
@@ -40,24 +41,7 @@ class Window(QMainWindow):
         b1 = QPushButton('Write Stream', self)
         b1.clicked.connect(self.on_write_button_clicked)
 
-        # Rectangles
-        r1 = QRect(QPoint(self.size().width() // 5, self.size().height() // 4), QSize(self.size().width() // 5, self.size().height() // 2))
-        r2 = QRect(QPoint((self.size().width() // 5) * 3, self.size().height() // 4), QSize(self.size().width() // 5, self.size().height() // 2))
-       
-        self.rects = [r1, r2]
-
-        # Used if blinking the rectangles in order
-        self.index = 0
-       
- 
-    def paintEvent(self, event):
-        # create a canvas
-        canvasPainter = QPainter(self)
-        canvasPainter.drawImage(self.rect(), self.image, self.image.rect())
-        self.image.fill(Qt.black)
-        canvasPainter.end()
-
-        # Adjust the height of the rectangles for if the screen size adjusts
+        # Rectangles, laid out on the canvas image (which is scaled to the window when painted)
         h = self.image.size().height()
         w = self.image.size().width()
 
@@ -66,34 +50,49 @@ class Window(QMainWindow):
 
         self.rects = [r1, r2]
 
-        # Draw the Rectangles on the canvas in black
+        # Pens and brushes, created once rather than on every paint
+        self.grayPen = QPen(QColor(191,191,191), 10, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.grayBrush = QBrush(QColor(191,191,191), Qt.SolidPattern)
+        self.whitePen = QPen(QColor(255,255,255), 10, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.whiteBrush = QBrush(QColor(255,255,255), Qt.SolidPattern)
+
+        # Used if blinking the rectangles in order
+        self.index = 0
+       
+ 
+    def paintEvent(self, event):
+        # Draw the Rectangles on the canvas in gray
+        self.image.fill(Qt.black)
         canvasPainter = QPainter(self.image)
 
-        canvasPainter.setPen(QPen(QColor(191,191,191), 10, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-        canvasPainter.setBrush(QBrush(QColor(191,191,191), Qt.SolidPattern))
+        canvasPainter.setPen(self.grayPen)
+        canvasPainter.setBrush(self.grayBrush)
 
         for rect in self.rects:
             canvasPainter.drawRect(rect)
 
-        # Draw the selected rectangle on the canvas in red
-        canvasPainter.setPen(QPen(QColor(255,255,255), 10, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-        canvasPainter.setBrush(QBrush(QColor(255,255,255), Qt.SolidPattern))
+        # Draw the selected rectangle on the canvas in white
+        canvasPainter.setPen(self.whitePen)
+        canvasPainter.setBrush(self.whiteBrush)
 
         canvasPainter.drawRect(self.rects[self.index])
 
         canvasPainter.end()
 
-        self.update()
+        # Copy the canvas onto the window
+        canvasPainter = QPainter(self)
+        canvasPainter.drawImage(self.rect(), self.image, self.image.rect())
+        canvasPainter.end()
 
     def selectRectangle(self):
-        if (len(self.data_stream) + 1) % (self.interval / self.frequency) == 0 or len(self.data_stream) == 0:
-            # Randomly select the next rectangle
-            selectedIndex = self.index
-
-            while selectedIndex == self.index:
-                selectedIndex = random.randint(0, len(self.rects) - 1)
+        if (len(self.data_stream) + 1) % self.samplesPerStimulus == 0 or len(self.data_stream) == 0:
+            # Randomly select the next rectangle, drawing only from the ones not currently selected
+            selectedIndex = random.randrange(len(self.rects) - 1)
+            if selectedIndex >= self.index:
+                selectedIndex += 1
         
             self.index = selectedIndex
+            self.update()
             
             # Select the next rectangle in the list
             ##################
@@ -107,7 +106,7 @@ class Window(QMainWindow):
     def on_write_button_clicked(self):
         num_channels = 1
 
-        data_array = np.array(self.data_stream).astype(np.float64)
+        data_array = np.asarray(self.data_stream, dtype=np.float64)
         physical_min, physical_max = np.min(data_array), np.max(data_array)
 
         # Create a new EDF file